@@ -1,9 +1,10 @@
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import create_engine, text
+from pydantic import BaseModel
+from sqlalchemy import bindparam, create_engine, text
 import pandas as pd
 import os
-from typing import Optional
+from typing import List, Optional
 
 # Create FastAPI app
 app = FastAPI(
@@ -24,6 +25,39 @@ app.add_middleware(
 database_url = "sqlite:///youtube_analytics.db"
 engine = create_engine(database_url)
 
+# Maximum number of IDs accepted by the batch lookup endpoints
+MAX_BATCH_IDS = 500
+
+
+class BatchLookupRequest(BaseModel):
+    ids: List[str]
+
+
+def fetch_by_ids(table: str, id_column: str, ids: List[str]):
+    """Fetch rows whose id_column is in ids with a single IN (...) query"""
+    # Drop duplicates but keep the caller's order
+    unique_ids = list(dict.fromkeys(ids))
+
+    if not unique_ids:
+        raise HTTPException(status_code=400, detail="At least one ID is required")
+    if len(unique_ids) > MAX_BATCH_IDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many IDs: maximum is {MAX_BATCH_IDS}"
+        )
+
+    query = text(
+        f"SELECT * FROM {table} WHERE {id_column} IN :ids"
+    ).bindparams(bindparam("ids", expanding=True))
+
+    with engine.connect() as conn:
+        result = conn.execute(query, {"ids": unique_ids})
+        rows = {row[id_column]: dict(row) for row in result.mappings()}
+
+    found = [rows[i] for i in unique_ids if i in rows]
+    not_found = [i for i in unique_ids if i not in rows]
+    return found, not_found
+
 
 @app.get("/")
 async def root():
@@ -34,7 +68,9 @@ async def root():
             "channels": "/channels",
             "videos": "/videos",
             "stats": "/stats",
-            "channel_videos": "/channels/{channel_id}/videos"
+            "channel_videos": "/channels/{channel_id}/videos",
+            "channels_batch": "/channels/batch",
+            "videos_batch": "/videos/batch"
         }
     }
 
@@ -68,6 +104,24 @@ async def get_channels(
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 
+@app.post("/channels/batch")
+async def get_channels_batch(request: BatchLookupRequest):
+    """Get details for many channels in one request"""
+    try:
+        channels, not_found = fetch_by_ids("youtube_channels", "channel_id", request.ids)
+
+        return {
+            "count": len(channels),
+            "channels": channels,
+            "not_found": not_found
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+
+
 @app.get("/channels/{channel_id}")
 async def get_channel(channel_id: str):
     """Get specific channel details"""
@@ -152,6 +206,24 @@ async def get_videos(
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 
+@app.post("/videos/batch")
+async def get_videos_batch(request: BatchLookupRequest):
+    """Get details for many videos in one request"""
+    try:
+        videos, not_found = fetch_by_ids("youtube_videos", "video_id", request.ids)
+
+        return {
+            "count": len(videos),
+            "videos": videos,
+            "not_found": not_found
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+
+
 @app.get("/stats")
 async def get_statistics():
     """Get overall statistics about the data"""